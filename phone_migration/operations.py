@@ -31,7 +31,7 @@ def shorten_path(path_str: str) -> str:
     return path_str
 
 
-def run_copy_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool = False, transfer_tracker=None, rename_duplicates: bool = True) -> Dict[str, int]:
+def run_copy_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool = False, transfer_tracker=None, rename_duplicates: bool = True, quiet: bool = False) -> Dict[str, int]:
     """
     Execute a copy rule: copy from phone to desktop without deleting from phone.
 
@@ -40,10 +40,15 @@ def run_copy_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool =
         device: Device dictionary with activation_uri
         verbose: Print verbose output
         transfer_tracker: Optional TransferStats instance for tracking
+        quiet: Skip all progress/summary output (for tests and scripted runs)
 
     Returns:
         Dictionary with counts: copied, renamed, errors
     """
+    # quiet implies no verbose per-file output either
+    if quiet:
+        verbose = False
+
     activation_uri = device.get("activation_uri", "")
     phone_path = rule.get("phone_path", "")
     desktop_path_str = rule.get("desktop_path", "")
@@ -52,7 +57,8 @@ def run_copy_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool =
     source_uri = paths.build_phone_uri(activation_uri, phone_path)
     dest_dir = paths.expand_desktop(desktop_path_str)
 
-    print(f"\n{Colors.BOLD}{Colors.BRIGHT_BLUE}📋 Copy:{Colors.RESET} {Colors.CYAN}{phone_path}{Colors.RESET} {Colors.DIM}→{Colors.RESET} {Colors.GREEN}{shorten_path(dest_dir)}{Colors.RESET}\n")
+    if not quiet:
+        print(f"\n{Colors.BOLD}{Colors.BRIGHT_BLUE}📋 Copy:{Colors.RESET} {Colors.CYAN}{phone_path}{Colors.RESET} {Colors.DIM}→{Colors.RESET} {Colors.GREEN}{shorten_path(dest_dir)}{Colors.RESET}\n")
 
     # Create destination directory
     paths.ensure_dir(dest_dir)
@@ -61,29 +67,31 @@ def run_copy_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool =
     stats = {"copied": 0, "renamed": 0, "errors": 0, "skipped": 0, "folders": 0}
 
     # Recursively process phone directory (no deletion)
-    _process_copy_directory(source_uri, dest_dir, stats, verbose, transfer_tracker=transfer_tracker, rename_duplicates=rename_duplicates)
+    _process_copy_directory(source_uri, dest_dir, stats, verbose, transfer_tracker=transfer_tracker, rename_duplicates=rename_duplicates, quiet=quiet)
 
     # Align based on longest label "Renamed:" (8 chars including emoji/symbol)
-    print(f"\n  {Colors.GREEN}✓ Copied:{Colors.RESET}   {stats['copied']} files")
-    if stats["folders"] > 0:
-        print(f" {Colors.BRIGHT_WHITE}📁 Folders:{Colors.RESET}  {stats['folders']}")
-    if stats["renamed"] > 0:
-        print(f"  {Colors.YELLOW}↻ Renamed:{Colors.RESET}  {stats['renamed']} (duplicates)")
-    if stats["skipped"] > 0:
-        print(f"  {Colors.CYAN}⊙ Exists:{Colors.RESET}   {stats['skipped']} files")
-    if stats["errors"] > 0:
-        print(f"  {Colors.YELLOW}⨠ Errors:{Colors.RESET}   {stats['errors']}")
+    if not quiet:
+        print(f"\n  {Colors.GREEN}✓ Copied:{Colors.RESET}   {stats['copied']} files")
+        if stats["folders"] > 0:
+            print(f" {Colors.BRIGHT_WHITE}📁 Folders:{Colors.RESET}  {stats['folders']}")
+        if stats["renamed"] > 0:
+            print(f"  {Colors.YELLOW}↻ Renamed:{Colors.RESET}  {stats['renamed']} (duplicates)")
+        if stats["skipped"] > 0:
+            print(f"  {Colors.CYAN}⊙ Exists:{Colors.RESET}   {stats['skipped']} files")
+        if stats["errors"] > 0:
+            print(f"  {Colors.YELLOW}⨠ Errors:{Colors.RESET}   {stats['errors']}")
 
     return stats
 
 
 def _process_copy_directory(source_uri: str, dest_dir: Path, 
-                            stats: Dict[str, int], verbose: bool, in_subfolder: bool = False, transfer_tracker=None, rename_duplicates: bool = True) -> None:
+                            stats: Dict[str, int], verbose: bool, in_subfolder: bool = False, transfer_tracker=None, rename_duplicates: bool = True, quiet: bool = False) -> None:
     """Recursively process a directory for copy operation (no deletion).
 
     Args:
         in_subfolder: True if we're inside a subfolder (to hide individual file output)
         transfer_tracker: Optional TransferStats instance for tracking
+        quiet: Skip all per-entry output
     """
     # List entries in source directory
     entries = gio_utils.gio_list(source_uri)
@@ -105,16 +113,17 @@ def _process_copy_directory(source_uri: str, dest_dir: Path,
         if is_dir:
             # Create corresponding subdirectory on desktop
             sub_dest_dir = dest_dir / entry
-            sub_dest_short = shorten_path(sub_dest_dir)
             paths.ensure_dir(sub_dest_dir)
             stats["folders"] += 1
-            print(f"  {Colors.BRIGHT_WHITE}📦{Colors.RESET} {Colors.BOLD}{entry}/{Colors.RESET} {Colors.DIM}→ {sub_dest_short}{Colors.RESET}")
+            if not quiet:
+                sub_dest_short = shorten_path(sub_dest_dir)
+                print(f"  {Colors.BRIGHT_WHITE}📦{Colors.RESET} {Colors.BOLD}{entry}/{Colors.RESET} {Colors.DIM}→ {sub_dest_short}{Colors.RESET}")
 
             # Recurse into subdirectory (track file count, mark as in_subfolder)
             folder_stats_before = stats["copied"]
-            _process_copy_directory(entry_uri, sub_dest_dir, stats, verbose, in_subfolder=True, transfer_tracker=transfer_tracker, rename_duplicates=rename_duplicates)
+            _process_copy_directory(entry_uri, sub_dest_dir, stats, verbose, in_subfolder=True, transfer_tracker=transfer_tracker, rename_duplicates=rename_duplicates, quiet=quiet)
             files_in_folder = stats["copied"] - folder_stats_before
-            if files_in_folder > 0 and not verbose:
+            if files_in_folder > 0 and not verbose and not quiet:
                 print(f"     {Colors.DIM}({files_in_folder} files){Colors.RESET}")
 
         elif "regular" in entry_type.lower() or entry_type == "1":  # Type 1 is regular file
@@ -133,7 +142,7 @@ def _process_copy_directory(source_uri: str, dest_dir: Path,
             if will_rename:
                 stats["renamed"] += 1
                 # Show rename with full destination path (only if not in subfolder or verbose)
-                if (gio_utils.DRY_RUN or verbose) and not in_subfolder:
+                if (gio_utils.DRY_RUN or verbose) and not in_subfolder and not quiet:
                     dest_short = shorten_path(dest_file)
                     print(f"  {Colors.YELLOW}↻{Colors.RESET} {Colors.DIM}{entry}{Colors.RESET} → {Colors.YELLOW}{dest_file.name}{Colors.RESET} {Colors.DIM}(duplicate → {dest_short}){Colors.RESET}")
 
@@ -141,7 +150,7 @@ def _process_copy_directory(source_uri: str, dest_dir: Path,
             file_size = gio_utils.get_file_size(info)
             
             # Copy file - show root level files (not in subfolder), but not if already shown via rename
-            show_copy = (not will_rename and not in_subfolder) or verbose
+            show_copy = ((not will_rename and not in_subfolder) or verbose) and not quiet
             if gio_utils.gio_copy(entry_uri, str(dest_file), recursive=False, overwrite=False, verbose=show_copy):
                 # Verify copy succeeded (skip verification in dry-run mode)
                 if gio_utils.DRY_RUN:
@@ -164,7 +173,7 @@ def _process_copy_directory(source_uri: str, dest_dir: Path,
                 stats["errors"] += 1
 
 
-def run_backup_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool = False, transfer_tracker=None, rename_duplicates: bool = False) -> Dict[str, int]:
+def run_backup_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool = False, transfer_tracker=None, rename_duplicates: bool = False, quiet: bool = False) -> Dict[str, int]:
     """
     Execute a backup rule: resumable copy with progress tracking.
     
@@ -174,10 +183,15 @@ def run_backup_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool
         verbose: Print verbose output
         transfer_tracker: Optional TransferStats instance for tracking
         rename_duplicates: Default False for backup (do nothing on conflicts)
+        quiet: Skip all progress/summary output (for tests and scripted runs)
     
     Returns:
         Dictionary with counts: copied, resumed, skipped, failed, errors
     """
+    # quiet implies no verbose per-file output either
+    if quiet:
+        verbose = False
+
     activation_uri = device.get("activation_uri", "")
     phone_path = rule.get("phone_path", "")
     desktop_path_str = rule.get("desktop_path", "")
@@ -187,7 +201,8 @@ def run_backup_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool
     source_uri = paths.build_phone_uri(activation_uri, phone_path)
     dest_dir = paths.expand_desktop(desktop_path_str)
     
-    print(f"\n{Colors.BOLD}{Colors.BRIGHT_YELLOW}💾 Backup:{Colors.RESET} {Colors.CYAN}{phone_path}{Colors.RESET} {Colors.DIM}→{Colors.RESET} {Colors.GREEN}{shorten_path(dest_dir)}{Colors.RESET}")
+    if not quiet:
+        print(f"\n{Colors.BOLD}{Colors.BRIGHT_YELLOW}💾 Backup:{Colors.RESET} {Colors.CYAN}{phone_path}{Colors.RESET} {Colors.DIM}→{Colors.RESET} {Colors.GREEN}{shorten_path(dest_dir)}{Colors.RESET}")
     
     # Create destination directory
     paths.ensure_dir(dest_dir)
@@ -197,11 +212,12 @@ def run_backup_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool
     already_copied = rule_state["copied"]
     
     # Show resume info if applicable
-    if len(already_copied) > 0:
+    if len(already_copied) > 0 and not quiet:
         print(f"\n  {Colors.CYAN}ℹ️  Resuming from previous run{Colors.RESET}")
         print(f"  {Colors.GREEN}✓ Already copied:{Colors.RESET} {len(already_copied)} files")
     
-    print(f"\n  {Colors.DIM}Scanning source directory...{Colors.RESET}")
+    if not quiet:
+        print(f"\n  {Colors.DIM}Scanning source directory...{Colors.RESET}")
     
     # Build list of ALL files in source (recursive)
     all_files = []
@@ -209,17 +225,19 @@ def run_backup_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool
     
     total_files = len(all_files)
     if total_files == 0:
-        print(f"  {Colors.YELLOW}No files found in source directory{Colors.RESET}")
+        if not quiet:
+            print(f"  {Colors.YELLOW}No files found in source directory{Colors.RESET}")
         return {"copied": 0, "resumed": len(already_copied), "skipped": 0, "failed": 0, "errors": 0}
     
     # Filter out already-copied files
     remaining_files = [f for f in all_files if f not in already_copied]
     
-    print(f"  {Colors.DIM}Found:{Colors.RESET} {total_files} total files")
-    if len(already_copied) > 0:
-        print(f"  {Colors.DIM}→ Remaining:{Colors.RESET} {len(remaining_files)} files to copy\n")
-    else:
-        print()
+    if not quiet:
+        print(f"  {Colors.DIM}Found:{Colors.RESET} {total_files} total files")
+        if len(already_copied) > 0:
+            print(f"  {Colors.DIM}→ Remaining:{Colors.RESET} {len(remaining_files)} files to copy\n")
+        else:
+            print()
     
     # Track statistics
     stats = {
@@ -255,10 +273,9 @@ def run_backup_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool
             continue
         
         # Progress indicator
-        current_total = len(already_copied) + i
-        percent = (current_total / total_files) * 100
-        
-        if verbose or (i % 10 == 0):  # Show every 10th file or all in verbose
+        if not quiet and (verbose or (i % 10 == 0)):  # Show every 10th file or all in verbose
+            current_total = len(already_copied) + i
+            percent = (current_total / total_files) * 100
             # Use full relative path for better file identification
             display_path = rel_path
             print(f"  {Colors.DIM}[{current_total}/{total_files} - {percent:.1f}%]{Colors.RESET} {display_path}")
@@ -283,8 +300,9 @@ def run_backup_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool
                 state.mark_file_failed(rule_id, rel_path, "Copy command failed")
         except KeyboardInterrupt:
             # Handle Ctrl+C gracefully
-            print(f"\n\n  {Colors.YELLOW}⚠ Interrupted!{Colors.RESET} Progress saved.")
-            print(f"  {Colors.CYAN}📋 To resume:{Colors.RESET} phone-sync --run -r {rule_id} -y\n")
+            if not quiet:
+                print(f"\n\n  {Colors.YELLOW}⚠ Interrupted!{Colors.RESET} Progress saved.")
+                print(f"  {Colors.CYAN}📋 To resume:{Colors.RESET} phone-sync --run -r {rule_id} -y\n")
             raise
         except Exception as e:
             stats["errors"] += 1
@@ -297,30 +315,32 @@ def run_backup_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool
     final_copied_count = len(already_copied) + stats["copied"]
     if final_copied_count >= total_files - stats["failed"]:
         # All done! Clear state
-        print(f"\n  {Colors.GREEN}✓ Smart copy complete!{Colors.RESET} All files copied.")
-        print(f"  {Colors.DIM}🗑️  State cleared.{Colors.RESET}")
+        if not quiet:
+            print(f"\n  {Colors.GREEN}✓ Smart copy complete!{Colors.RESET} All files copied.")
+            print(f"  {Colors.DIM}🗑️  State cleared.{Colors.RESET}")
         state.mark_rule_complete(rule_id)
-    elif stats["failed"] > 0:
+    elif stats["failed"] > 0 and not quiet:
         print(f"\n  {Colors.YELLOW}⚠ {stats['failed']} files failed.{Colors.RESET} Run again to retry.")
     
     # Summary
-    print(f"\n  {Colors.GREEN}✓ Copied:{Colors.RESET}   {stats['copied']} files (this run)")
-    if stats["resumed"] > 0:
-        print(f"  {Colors.CYAN}↻ Resumed:{Colors.RESET}  {stats['resumed']} files (previous runs)")
-    if stats["skipped"] > 0:
-        print(f"  {Colors.YELLOW}⊙ Exists:{Colors.RESET}   {stats['skipped']} files (already exist)")
-    if stats["failed"] > 0:
-        print(f"  {Colors.RED}✕ Failed:{Colors.RESET}   {stats['failed']} files")
+    if not quiet:
+        print(f"\n  {Colors.GREEN}✓ Copied:{Colors.RESET}   {stats['copied']} files (this run)")
+        if stats["resumed"] > 0:
+            print(f"  {Colors.CYAN}↻ Resumed:{Colors.RESET}  {stats['resumed']} files (previous runs)")
+        if stats["skipped"] > 0:
+            print(f"  {Colors.YELLOW}⊙ Exists:{Colors.RESET}   {stats['skipped']} files (already exist)")
+        if stats["failed"] > 0:
+            print(f"  {Colors.RED}✕ Failed:{Colors.RESET}   {stats['failed']} files")
     
     return stats
 
 
-def run_smart_copy_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool = False, transfer_tracker=None, rename_duplicates: bool = True) -> Dict[str, int]:
+def run_smart_copy_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool = False, transfer_tracker=None, rename_duplicates: bool = True, quiet: bool = False) -> Dict[str, int]:
     """
     Deprecated: Use run_backup_rule instead.
     Execute a smart copy rule: resumable copy with progress tracking.
     """
-    return run_backup_rule(rule, device, verbose, transfer_tracker, rename_duplicates=False)
+    return run_backup_rule(rule, device, verbose, transfer_tracker, rename_duplicates=False, quiet=quiet)
 
 
 def _build_file_list(source_uri: str, rel_path: str, file_list: list) -> None:
@@ -356,7 +376,7 @@ def _build_file_list(source_uri: str, rel_path: str, file_list: list) -> None:
             file_list.append(entry_rel_path)
 
 
-def run_move_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool = False, transfer_tracker=None, rename_duplicates: bool = True) -> Dict[str, int]:
+def run_move_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool = False, transfer_tracker=None, rename_duplicates: bool = True, quiet: bool = False) -> Dict[str, int]:
     """
     Execute a move rule: copy from phone to desktop, then delete from phone.
 
@@ -365,10 +385,15 @@ def run_move_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool =
         device: Device dictionary with activation_uri
         verbose: Print verbose output
         transfer_tracker: Optional TransferStats instance for tracking
+        quiet: Skip all progress/summary output (for tests and scripted runs)
 
     Returns:
         Dictionary with counts: copied, renamed, deleted, errors
     """
+    # quiet implies no verbose per-file output either
+    if quiet:
+        verbose = False
+
     activation_uri = device.get("activation_uri", "")
     phone_path = rule.get("phone_path", "")
     desktop_path_str = rule.get("desktop_path", "")
@@ -377,7 +402,8 @@ def run_move_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool =
     source_uri = paths.build_phone_uri(activation_uri, phone_path)
     dest_dir = paths.expand_desktop(desktop_path_str)
 
-    print(f"\n{Colors.BOLD}{Colors.BRIGHT_BLUE}→{Colors.RESET} {Colors.BOLD}Move:{Colors.RESET} {Colors.CYAN}{phone_path}{Colors.RESET} {Colors.DIM}→{Colors.RESET} {Colors.GREEN}{shorten_path(dest_dir)}{Colors.RESET}\n")
+    if not quiet:
+        print(f"\n{Colors.BOLD}{Colors.BRIGHT_BLUE}→{Colors.RESET} {Colors.BOLD}Move:{Colors.RESET} {Colors.CYAN}{phone_path}{Colors.RESET} {Colors.DIM}→{Colors.RESET} {Colors.GREEN}{shorten_path(dest_dir)}{Colors.RESET}\n")
 
     # Create destination directory
     paths.ensure_dir(dest_dir)
@@ -389,7 +415,7 @@ def run_move_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool =
     files_to_delete = []
 
     # Recursively process phone directory
-    _process_move_directory(source_uri, dest_dir, files_to_delete, stats, verbose, transfer_tracker=transfer_tracker, rename_duplicates=rename_duplicates)
+    _process_move_directory(source_uri, dest_dir, files_to_delete, stats, verbose, transfer_tracker=transfer_tracker, rename_duplicates=rename_duplicates, quiet=quiet)
 
     # Delete files from phone after successful copy
     # Don't list individual files - just count them
@@ -408,28 +434,30 @@ def run_move_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool =
     _cleanup_empty_dirs(source_uri, verbose)
 
     # Align based on longest label "Renamed:" (8 chars including emoji/symbol)
-    print(f"\n  {Colors.GREEN}✓ Copied:{Colors.RESET}   {stats['copied']} files")
-    if stats["folders"] > 0:
-        print(f" {Colors.BRIGHT_WHITE}📁 Folders:{Colors.RESET}  {stats['folders']}")
-    if stats["renamed"] > 0:
-        print(f"  {Colors.YELLOW}↻ Renamed:{Colors.RESET}  {stats['renamed']} (duplicates)")
-    if stats["skipped"] > 0:
-        print(f"  {Colors.CYAN}⊙ Exists:{Colors.RESET}   {stats['skipped']} files")
-    if stats["deleted"] > 0:
-        print(f" {Colors.RED}🗑️  Deleted:{Colors.RESET}  {stats['deleted']}")
-    if stats["errors"] > 0:
-        print(f"  {Colors.YELLOW}⨠ Errors:{Colors.RESET}   {stats['errors']}")
+    if not quiet:
+        print(f"\n  {Colors.GREEN}✓ Copied:{Colors.RESET}   {stats['copied']} files")
+        if stats["folders"] > 0:
+            print(f" {Colors.BRIGHT_WHITE}📁 Folders:{Colors.RESET}  {stats['folders']}")
+        if stats["renamed"] > 0:
+            print(f"  {Colors.YELLOW}↻ Renamed:{Colors.RESET}  {stats['renamed']} (duplicates)")
+        if stats["skipped"] > 0:
+            print(f"  {Colors.CYAN}⊙ Exists:{Colors.RESET}   {stats['skipped']} files")
+        if stats["deleted"] > 0:
+            print(f" {Colors.RED}🗑️  Deleted:{Colors.RESET}  {stats['deleted']}")
+        if stats["errors"] > 0:
+            print(f"  {Colors.YELLOW}⨠ Errors:{Colors.RESET}   {stats['errors']}")
 
     return stats
 
 
 def _process_move_directory(source_uri: str, dest_dir: Path, files_to_delete: list,
-                            stats: Dict[str, int], verbose: bool, in_subfolder: bool = False, transfer_tracker=None, rename_duplicates: bool = True) -> None:
+                            stats: Dict[str, int], verbose: bool, in_subfolder: bool = False, transfer_tracker=None, rename_duplicates: bool = True, quiet: bool = False) -> None:
     """Recursively process a directory for move operation.
 
     Args:
         in_subfolder: True if we're inside a subfolder (to hide individual file output)
         transfer_tracker: Optional TransferStats instance for tracking
+        quiet: Skip all per-entry output
     """
     # List entries in source directory
     entries = gio_utils.gio_list(source_uri)
@@ -451,16 +479,17 @@ def _process_move_directory(source_uri: str, dest_dir: Path, files_to_delete: li
         if is_dir:
             # Create corresponding subdirectory on desktop
             sub_dest_dir = dest_dir / entry
-            sub_dest_short = shorten_path(sub_dest_dir)
             paths.ensure_dir(sub_dest_dir)
             stats["folders"] += 1
-            print(f"  {Colors.BRIGHT_WHITE}📦{Colors.RESET} {Colors.BOLD}{entry}/{Colors.RESET} {Colors.DIM}→ {sub_dest_short}{Colors.RESET}")
+            if not quiet:
+                sub_dest_short = shorten_path(sub_dest_dir)
+                print(f"  {Colors.BRIGHT_WHITE}📦{Colors.RESET} {Colors.BOLD}{entry}/{Colors.RESET} {Colors.DIM}→ {sub_dest_short}{Colors.RESET}")
 
             # Recurse into subdirectory (track file count, mark as in_subfolder)
             folder_stats_before = stats["copied"]
-            _process_move_directory(entry_uri, sub_dest_dir, files_to_delete, stats, verbose, in_subfolder=True, transfer_tracker=transfer_tracker, rename_duplicates=rename_duplicates)
+            _process_move_directory(entry_uri, sub_dest_dir, files_to_delete, stats, verbose, in_subfolder=True, transfer_tracker=transfer_tracker, rename_duplicates=rename_duplicates, quiet=quiet)
             files_in_folder = stats["copied"] - folder_stats_before
-            if files_in_folder > 0 and not verbose:
+            if files_in_folder > 0 and not verbose and not quiet:
                 print(f"     {Colors.DIM}({files_in_folder} files){Colors.RESET}")
 
         elif "regular" in entry_type.lower() or entry_type == "1":  # Type 1 is regular file
@@ -479,7 +508,7 @@ def _process_move_directory(source_uri: str, dest_dir: Path, files_to_delete: li
             if will_rename:
                 stats["renamed"] += 1
                 # Show rename with full destination path (only if not in subfolder or verbose)
-                if (gio_utils.DRY_RUN or verbose) and not in_subfolder:
+                if (gio_utils.DRY_RUN or verbose) and not in_subfolder and not quiet:
                     dest_short = shorten_path(dest_file)
                     print(f"  {Colors.YELLOW}↻{Colors.RESET} {Colors.DIM}{entry}{Colors.RESET} → {Colors.YELLOW}{dest_file.name}{Colors.RESET} {Colors.DIM}(duplicate → {dest_short}){Colors.RESET}")
 
@@ -487,7 +516,7 @@ def _process_move_directory(source_uri: str, dest_dir: Path, files_to_delete: li
             file_size = gio_utils.get_file_size(info)
             
             # Copy file - show root level files (not in subfolder), but not if already shown via rename
-            show_copy = (not will_rename and not in_subfolder) or verbose
+            show_copy = ((not will_rename and not in_subfolder) or verbose) and not quiet
             if gio_utils.gio_copy(entry_uri, str(dest_file), recursive=False, overwrite=False, verbose=show_copy):
                 # Verify copy succeeded (skip verification in dry-run mode)
                 if gio_utils.DRY_RUN:
@@ -544,7 +573,7 @@ def _cleanup_empty_dirs(dir_uri: str, verbose: bool, skip_root: bool = True) ->
             pass  # Ignore errors - directory might not be empty
 
 
-def run_sync_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool = False, transfer_tracker=None, rename_duplicates: bool = True) -> Dict[str, int]:
+def run_sync_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool = False, transfer_tracker=None, rename_duplicates: bool = True, quiet: bool = False) -> Dict[str, int]:
     """
     Execute a sync rule: mirror desktop to phone (desktop is source of truth).
 
@@ -553,10 +582,15 @@ def run_sync_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool =
         device: Device dictionary with activation_uri
         verbose: Print verbose output
         transfer_tracker: Optional TransferStats instance for tracking
+        quiet: Skip all progress/summary output (for tests and scripted runs)
 
     Returns:
         Dictionary with counts: copied, deleted, errors
     """
+    # quiet implies no verbose per-file output either
+    if quiet:
+        verbose = False
+
     activation_uri = device.get("activation_uri", "")
     desktop_path_str = rule.get("desktop_path", "")
     phone_path = rule.get("phone_path", "")
@@ -565,10 +599,12 @@ def run_sync_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool =
     src_dir = paths.expand_desktop(desktop_path_str)
     dest_uri = paths.build_phone_uri(activation_uri, phone_path)
 
-    print(f"\n{Colors.BOLD}{Colors.BRIGHT_CYAN}🔄 Sync:{Colors.RESET} {Colors.GREEN}{shorten_path(src_dir)}{Colors.RESET} → {Colors.CYAN}{phone_path}{Colors.RESET}")
+    if not quiet:
+        print(f"\n{Colors.BOLD}{Colors.BRIGHT_CYAN}🔄 Sync:{Colors.RESET} {Colors.GREEN}{shorten_path(src_dir)}{Colors.RESET} → {Colors.CYAN}{phone_path}{Colors.RESET}")
 
     if not src_dir.exists():
-        print(f"  Warning: Desktop source does not exist: {src_dir}")
+        if not quiet:
+            print(f"  Warning: Desktop source does not exist: {src_dir}")
         return {"copied": 0, "deleted": 0, "errors": 1}
 
     # Ensure destination exists on phone
@@ -587,6 +623,9 @@ def run_sync_rule(rule: Dict[str, Any], device: Dict[str, Any], verbose: bool =
     if rule.get("delete_extraneous", True):
         _delete_extraneous_on_phone(dest_uri, "", expected_phone_files, stats, verbose)
 
+    if quiet:
+        return stats
+
     # Print summary with all relevant stats
     summary_parts = []
     if stats["copied"] > 0:
@@ -36,25 +36,32 @@ def estimate_transfer_size(source_path: str, rule_type: str = "copy") -> int:
     
     total_bytes = 0
     visited_inodes = set()
+    pending = [source_path]
     
-    for root, dirs, files in os.walk(source_path, followlinks=True):
+    # One os.scandir per directory; sizes come from DirEntry.stat(), which
+    # follows symlinks like the transfer itself does
+    while pending:
+        root = pending.pop()
         # Guard against symlink loops
         try:
             inode = os.stat(root).st_ino
             if inode in visited_inodes:
-                dirs[:] = []  # Don't recurse
                 continue
             visited_inodes.add(inode)
+            entries = os.scandir(root)
         except OSError:
             continue
         
-        for file in files:
-            file_path = os.path.join(root, file)
-            try:
-                total_bytes += os.path.getsize(file_path)
-            except OSError as e:
-                logger.warning(f"Could not get size of {file_path}: {e}")
-                continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        pending.append(entry.path)
+                    else:
+                        total_bytes += entry.stat().st_size
+                except OSError as e:
+                    logger.warning(f"Could not get size of {entry.path}: {e}")
+                    continue
     
     return total_bytes
 
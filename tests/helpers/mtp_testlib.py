@@ -1,17 +1,28 @@
 """Helpers for testing MTP operations on connected Android device."""
 
+import hashlib
+import os
 import subprocess
-import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 
 class MTPDevice:
     """Wrapper for MTP device operations during testing."""
     
+    # Most files handed to a single `gio copy` by push_files
+    PUSH_BATCH_SIZE = 70
+    
+    # Lowercased gio errors for a directory that already exists (wording varies by backend)
+    EXISTS_ERRORS = ("already exists", "file exists")
+    
     def __init__(self, activation_uri: str):
         """Initialize with device activation URI."""
         self.uri = activation_uri
+        # Computed once; every phone path is appended to this prefix
+        self._uri_prefix = activation_uri if activation_uri.endswith('/') else f"{activation_uri}/"
     
     def _run_gio(self, *args, check: bool = False) -> Tuple[int, str, str]:
         """Run a gio command and return (returncode, stdout, stderr)."""
@@ -21,62 +32,148 @@ class MTPDevice:
             raise RuntimeError(f"GIO command failed: {' '.join(cmd)}\n{result.stderr}")
         return result.returncode, result.stdout, result.stderr
     
+    def _uri(self, path: str) -> str:
+        """Build the full gio URI for a phone path."""
+        path_clean = path.lstrip('/')
+        return f"{self._uri_prefix}{path_clean}" if path_clean else self.uri.rstrip('/')
+    
+    def _is_exists_error(self, err: str) -> bool:
+        """Return True if a gio error only reports that the target already exists."""
+        err_lower = err.lower()
+        return any(phrase in err_lower for phrase in self.EXISTS_ERRORS)
+    
     def mkdir(self, path: str) -> None:
         """Create directory on phone. Silently ignores if directory already exists."""
-        # Handle path properly - don't add extra slash
-        path_clean = path.lstrip('/')
-        if self.uri.endswith('/'):
-            full_uri = f"{self.uri}{path_clean}"
-        else:
-            full_uri = f"{self.uri}/{path_clean}"
+        full_uri = self._uri(path)
         rc, _, err = self._run_gio("mkdir", "-p", full_uri)
-        # Ignore "already exists" errors
-        if rc != 0 and "already exists" not in err.lower() and "target file already exists" not in err.lower():
+        if rc != 0 and not self._is_exists_error(err):
             raise RuntimeError(f"Failed to create {path}: {err}")
     
+    def mkdir_many(self, paths: List[str]) -> None:
+        """Create many directories (and their parents) with a single gio call."""
+        # Parents are implied by -p; passing them too would only add "exists" errors
+        leaves = sorted(p.strip('/') for p in set(paths))
+        leaves = [p for i, p in enumerate(leaves)
+                  if not (i + 1 < len(leaves) and leaves[i + 1].startswith(p + '/'))]
+        if not leaves:
+            return
+        
+        rc, _, err = self._run_gio("mkdir", "-p", *(f"{self._uri_prefix}{p}" for p in leaves))
+        if rc != 0:
+            # gio keeps going after a failed location; only "already exists" is harmless
+            failures = [line for line in err.splitlines()
+                        if line.strip() and not self._is_exists_error(line)]
+            if failures:
+                raise RuntimeError(f"Failed to create directories: {'; '.join(failures)}")
+    
     def push_file(self, local_path: Path, phone_path: str) -> None:
         """Copy file from desktop to phone."""
         if not local_path.exists():
             raise FileNotFoundError(f"Local file not found: {local_path}")
         
-        path_clean = phone_path.lstrip('/')
-        if self.uri.endswith('/'):
-            full_uri = f"{self.uri}{path_clean}"
-        else:
-            full_uri = f"{self.uri}/{path_clean}"
+        full_uri = self._uri(phone_path)
         rc, _, err = self._run_gio("copy", str(local_path), full_uri)
         if rc != 0:
             raise RuntimeError(f"Failed to push {phone_path}: {err}")
     
+    def push_files(self, pairs: List[Tuple[Path, str]]) -> None:
+        """
+        Copy many files from desktop to phone with one gio call per destination directory.
+        
+        Sources are staged under their destination names (hardlinks, falling back to
+        symlinks) so a single `gio copy SRC... DIR` places every file in that directory.
+        
+        Raises:
+            FileNotFoundError: If a local source file does not exist
+            ValueError: If two pairs share a phone destination path
+        """
+        groups: Dict[str, List[Tuple[Path, str]]] = {}
+        seen = set()
+        duplicates = []
+        for local_path, phone_path in pairs:
+            if not local_path.exists():
+                raise FileNotFoundError(f"Local file not found: {local_path}")
+            dest = phone_path.rstrip('/')
+            if dest in seen:
+                duplicates.append(dest)
+                continue
+            seen.add(dest)
+            parent, _, name = dest.rpartition('/')
+            groups.setdefault(parent, []).append((local_path, name))
+        
+        # Both sources would be staged under the same name in one directory
+        if duplicates:
+            raise ValueError(f"Duplicate phone destination paths: {', '.join(sorted(set(duplicates)))}")
+        
+        for parent, items in groups.items():
+            dir_uri = self._uri(parent)
+            
+            with tempfile.TemporaryDirectory(prefix="mtp_push_") as staging:
+                staged = []
+                for local_path, name in items:
+                    target = Path(staging) / name
+                    try:
+                        os.link(local_path, target)
+                    except OSError:
+                        os.symlink(local_path.resolve(), target)
+                    staged.append(str(target))
+                
+                # Cap files per call so argv stays bounded for very large batches
+                for start in range(0, len(staged), self.PUSH_BATCH_SIZE):
+                    batch = staged[start:start + self.PUSH_BATCH_SIZE]
+                    rc, _, err = self._run_gio("copy", *batch, dir_uri)
+                    if rc != 0:
+                        raise RuntimeError(f"Failed to push {len(batch)} files to {parent}: {err}")
+    
     def push_file_recursive(self, local_dir: Path, phone_path: str) -> None:
-        """Recursively copy files from local directory to phone."""
+        """
+        Recursively copy files from local directory to phone.
+        
+        Subdirectories are created with one mkdir_many call and files are pushed
+        with push_files, i.e. one gio copy per destination directory.
+        """
         if not local_dir.is_dir():
             raise NotADirectoryError(f"{local_dir} is not a directory")
         
-        for item in local_dir.rglob('*'):
-            if item.is_file():
-                # Calculate relative path
-                rel_path = item.relative_to(local_dir)
-                dest_phone_path = f"{phone_path}/{rel_path}".replace('\\', '/')
-                
-                # Create parent dir on phone if needed
-                parent_path = str(Path(dest_phone_path).parent)
-                if parent_path != phone_path:
-                    try:
-                        self.mkdir(parent_path)
-                    except:
-                        pass  # Dir might already exist
-                
-                # Push file
-                self.push_file(item, dest_phone_path)
+        # scandir walk: entry types come from the directory read, so only
+        # symlinks cost a stat and no Path is built per directory entry
+        phone_dirs = set()
+        pairs: List[Tuple[Path, str]] = []
+        pending = [(str(local_dir), "")]
+        while pending:
+            current, rel = pending.pop()
+            with os.scandir(current) as it:
+                for entry in it:
+                    rel_name = f"{rel}/{entry.name}" if rel else entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append((entry.path, rel_name))
+                    elif entry.is_file():
+                        if rel:
+                            phone_dirs.add(f"{phone_path}/{rel}")
+                        pairs.append((Path(entry.path), f"{phone_path}/{rel_name}"))
+        
+        self.mkdir_many(list(phone_dirs))
+        self.push_files(pairs)
+    
+    def populate(self, dirs: List[str], pairs: List[Tuple[Path, str]], max_workers: int = 2) -> None:
+        """
+        Create directories, then push files with several directories' uploads in flight.
+        
+        One mkdir_many call makes every directory; the files are grouped by
+        destination directory and each group goes through push_files on a worker,
+        so one directory's device commit overlaps the next one's upload.
+        """
+        self.mkdir_many(dirs)
+        groups: Dict[str, List[Tuple[Path, str]]] = {}
+        for local_path, phone_path in pairs:
+            groups.setdefault(phone_path.rstrip('/').rpartition('/')[0], []).append((local_path, phone_path))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(self.push_files, groups.values()))
     
     def list_dir(self, path: str = "/") -> List[str]:
         """List directory contents on phone."""
-        path_clean = path.lstrip('/')
-        if self.uri.endswith('/'):
-            full_uri = f"{self.uri}{path_clean}" if path_clean else self.uri.rstrip('/')
-        else:
-            full_uri = f"{self.uri}/{path_clean}" if path_clean else self.uri
+        full_uri = self._uri(path)
         rc, stdout, err = self._run_gio("list", full_uri)
         if rc != 0:
             return []
@@ -84,11 +181,7 @@ class MTPDevice:
     
     def get_file_info(self, path: str) -> Dict[str, str]:
         """Get file information from phone."""
-        path_clean = path.lstrip('/')
-        if self.uri.endswith('/'):
-            full_uri = f"{self.uri}{path_clean}" if path_clean else self.uri.rstrip('/')
-        else:
-            full_uri = f"{self.uri}/{path_clean}" if path_clean else self.uri
+        full_uri = self._uri(path)
         rc, stdout, err = self._run_gio("info", full_uri)
         if rc != 0:
             return {}
@@ -102,83 +195,188 @@ class MTPDevice:
     
     def remove(self, path: str) -> None:
         """Remove file or directory from phone."""
-        path_clean = path.lstrip('/')
-        if self.uri.endswith('/'):
-            full_uri = f"{self.uri}{path_clean}"
-        else:
-            full_uri = f"{self.uri}/{path_clean}"
+        full_uri = self._uri(path)
         rc, _, err = self._run_gio("remove", full_uri)
         if rc != 0:
             raise RuntimeError(f"Failed to remove {path}: {err}")
     
     def remove_recursive(self, path: str) -> None:
-        """Recursively remove directory and all contents from phone."""
-        # Get all items in directory
-        try:
-            entries = self.list_dir(path)
-        except:
-            # Directory doesn't exist, nothing to remove
+        """
+        Recursively remove directory and all contents from phone.
+        
+        Raises:
+            ValueError: if path names the device root ("" or "/")
+        """
+        path_clean = path.strip('/')
+        if not path_clean:
+            raise ValueError(f"Refusing to recursively remove the device root (path={path!r})")
+        dir_uri = self._uri(path_clean)
+        
+        # Files, empty directories and missing paths need only this one call
+        rc, _, _ = self._run_gio("remove", "-f", dir_uri)
+        if rc == 0:
             return
         
-        # Remove files and recurse into subdirectories
-        for entry in entries:
-            entry_path = f"{path}/{entry}".replace('//', '/')
-            info = self.get_file_info(entry_path)
-            entry_type = info.get('type', 'unknown')
-            
-            if 'directory' in entry_type.lower() or entry_type == '2':
-                # Recurse
-                self.remove_recursive(entry_path)
+        # Non-empty directory: one typed listing (no per-entry info calls), recurse
+        # into subdirectories, then delete all files here in a single gio call
+        file_uris = []
+        dir_prefix = f"{path_clean}/"
+        uri_prefix = f"{dir_uri}/"
+        for name, is_dir in self.list_entries(path_clean):
+            if is_dir:
+                self.remove_recursive(dir_prefix + name)
             else:
-                # Remove file
-                try:
-                    self.remove(entry_path)
-                except:
-                    pass  # Continue even if file removal fails
-        
-        # Finally remove the directory itself
-        try:
-            self.remove(path)
-        except:
-            pass  # Directory might not be empty or other issues
+                file_uris.append(uri_prefix + name)
+        if file_uris:
+            self._run_gio("remove", "-f", *file_uris)
+        
+        # Finally remove the directory itself (best effort, like the file removals)
+        self._run_gio("remove", "-f", dir_uri)
+    
+    def remove_many(self, paths: List[str], max_workers: int = 4) -> Dict[str, str]:
+        """
+        Recursively remove several independent directories in parallel.
+        
+        Returns:
+            Mapping of path -> error message for every path that failed
+        """
+        def _remove(path: str) -> Optional[str]:
+            try:
+                self.remove_recursive(path)
+            except Exception as e:
+                return str(e)
+            return None
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_remove, paths))
+        return {path: error for path, error in zip(paths, results) if error}
     
     def path_exists(self, path: str) -> bool:
         """Check if path exists on phone."""
         info = self.get_file_info(path)
         return bool(info)
     
+    def paths_exist(self, paths: List[str]) -> Dict[str, bool]:
+        """Check many paths with one directory listing per distinct parent."""
+        listings: Dict[str, set] = {}
+        result = {}
+        for path in paths:
+            parent, _, name = path.rstrip('/').rpartition('/')
+            if parent not in listings:
+                listings[parent] = set(self.list_dir(parent or "/"))
+            result[path] = name in listings[parent]
+        return result
+    
     def directory_tree(self, path: str = "/", prefix: str = "") -> Dict[str, any]:
-        """Build a tree structure of phone directory."""
-        try:
-            entries = self.list_dir(path)
-        except:
-            return {}
+        """
+        Build a tree structure of phone directory.
         
+        Every node has both a "files" list and a "dirs" dict, possibly empty.
+        """
         tree = {"files": [], "dirs": {}}
         
-        for entry in entries:
-            entry_path = f"{path}/{entry}".replace('//', '/')
-            info = self.get_file_info(entry_path)
-            entry_type = info.get('type', 'unknown')
-            
-            if 'directory' in entry_type.lower() or entry_type == '2':
-                # Recurse into directory
-                tree["dirs"][entry] = self.directory_tree(entry_path, prefix + "  ")
-            else:
-                # Add file
-                size = info.get('size', '0')
-                tree["files"].append({"name": entry, "size": size})
+        # Walked with an explicit stack (no recursion limit or per-level frames);
+        # long listing carries type and size, so no per-entry info call is needed
+        pending = [(path, tree)]
+        while pending:
+            current, node = pending.pop()
+            dir_prefix = current if current.endswith('/') else f"{current}/"
+            for entry, is_dir, size in self._list_long(current):
+                if is_dir:
+                    child = {"files": [], "dirs": {}}
+                    node["dirs"][entry] = child
+                    pending.append((dir_prefix + entry, child))
+                else:
+                    node["files"].append({"name": entry, "size": str(size)})
         
         return tree
     
-    def count_files(self, path: str = "/") -> int:
-        """Recursively count files in directory."""
-        tree = self.directory_tree(path)
-        count = len(tree.get("files", []))
-        for subdir in tree.get("dirs", {}).values():
-            # This is a simplified count - would need recursive call
-            pass
+    def list_entries(self, path: str = "/") -> List[Tuple[str, bool]]:
+        """List directory contents as (name, is_directory) pairs in a single gio call."""
+        return [(name, is_dir) for name, is_dir, _ in self._list_long(path)]
+    
+    def _list_long(self, path: str) -> List[Tuple[str, bool, int]]:
+        """List directory contents as (name, is_directory, size) triples."""
+        full_uri = self._uri(path)
+        # Long format prints "name<TAB>size<TAB>(type)" so no per-entry info call is needed
+        rc, stdout, err = self._run_gio("list", "-l", full_uri)
+        if rc != 0:
+            return []
+        
+        entries = []
+        for line in stdout.splitlines():
+            parts = line.split('\t')
+            name = parts[0].strip()
+            if not name:
+                continue
+            entry_type = parts[2] if len(parts) > 2 else ""
+            size = int(parts[1]) if len(parts) > 1 and parts[1].strip().isdigit() else 0
+            entries.append((name, "directory" in entry_type, size))
+        return entries
+    
+    def iter_files(self, path: str = "/") -> Iterator[str]:
+        """
+        Lazily yield the path of every file under a directory, relative to it.
+        
+        Directories are listed only as the generator is consumed, so callers
+        that stop early never list the rest of the tree.
+        """
+        pending = [(path, "")]
+        while pending:
+            current, rel = pending.pop()
+            dir_prefix = current if current.endswith('/') else f"{current}/"
+            rel_prefix = f"{rel}/" if rel else ""
+            for name, is_dir in self.list_entries(current):
+                if is_dir:
+                    pending.append((dir_prefix + name, rel_prefix + name))
+                else:
+                    yield rel_prefix + name
+    
+    def count_files(self, path: str = "/", suffix: Optional[str] = None,
+                    limit: Optional[int] = None) -> int:
+        """
+        Recursively count files in directory without building a tree.
+        
+        Args:
+            path: Phone directory to count
+            suffix: Only count files ending with this suffix (e.g. ".mp4")
+            limit: Stop walking once this many files are found (result is capped at limit)
+        """
+        count = 0
+        for name in self.iter_files(path):
+            if suffix is None or name.endswith(suffix):
+                count += 1
+                if limit is not None and count >= limit:
+                    break
         return count
+    
+    def tree_fingerprint(self, path: str = "/") -> Tuple[int, int]:
+        """
+        Hash the (relative path, size) of every file under a directory.
+        
+        Two fingerprints are equal only if the same files with the same sizes
+        are present, so pre/post checks become a single integer comparison.
+        
+        Returns:
+            Tuple of (64-bit fingerprint, file count)
+        """
+        files = []
+        pending = [(path, "")]
+        while pending:
+            current, rel = pending.pop()
+            dir_prefix = current if current.endswith('/') else f"{current}/"
+            rel_prefix = f"{rel}/" if rel else ""
+            for name, is_dir, size in self._list_long(current):
+                rel_name = rel_prefix + name
+                if is_dir:
+                    pending.append((dir_prefix + name, rel_name))
+                else:
+                    files.append((rel_name, size))
+        
+        digest = hashlib.blake2b(digest_size=8)
+        for rel_name, size in sorted(files):
+            digest.update(f"{rel_name}\0{size}\n".encode())
+        return int.from_bytes(digest.digest(), "big"), len(files)
 
 
 def compare_trees(tree1: Dict, tree2: Dict, path: str = "") -> List[str]:
@@ -3,9 +3,11 @@ Tests for phone migration operations (move, copy, sync, smart_copy).
 Uses temporary directories to simulate file operations without requiring MTP device.
 """
 
+import io
 import unittest
 import tempfile
 import shutil
+from contextlib import redirect_stdout
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
@@ -309,6 +311,64 @@ class TestSmartCopyOperation(TestOperationsBase):
         self.assertIsInstance(stats, dict)
 
 
+class TestQuietMode(TestOperationsBase):
+    """Test that quiet=True silences output without changing results."""
+    
+    def run_sync(self, quiet: bool):
+        """Run a sync of two new files, returning (stats, captured stdout)."""
+        rule = {
+            "desktop_path": str(self.source_dir),
+            "phone_path": "/Videos/sync"
+        }
+        device = {"activation_uri": "mtp://device/"}
+        out = io.StringIO()
+        
+        with patch('phone_migration.paths.build_phone_uri', return_value="mtp://device/Videos/sync"):
+            with patch('phone_migration.paths.expand_desktop', return_value=self.source_dir):
+                with patch('phone_migration.gio_utils.gio_mkdir'):
+                    with patch('phone_migration.gio_utils.gio_info', return_value=None):
+                        with patch('phone_migration.gio_utils.gio_copy', return_value=True):
+                            with patch('phone_migration.operations._delete_extraneous_on_phone'):
+                                with redirect_stdout(out):
+                                    stats = operations.run_sync_rule(rule, device, verbose=True, quiet=quiet)
+        return stats, out.getvalue()
+    
+    def test_quiet_sync_prints_nothing_and_matches_stats(self):
+        """quiet=True prints nothing (even with verbose=True) and returns the same stats."""
+        self.create_file(self.source_dir, "file1.txt", "content1")
+        self.create_file(self.source_dir, "file2.txt", "content2")
+        
+        loud_stats, loud_out = self.run_sync(quiet=False)
+        quiet_stats, quiet_out = self.run_sync(quiet=True)
+        
+        self.assertNotEqual(loud_out, "")
+        self.assertEqual(quiet_out, "")
+        self.assertEqual(quiet_stats, loud_stats)
+    
+    @patch('phone_migration.state.load_rule_state', return_value={"copied": [], "failed": []})
+    @patch('phone_migration.state.save_rule_state')
+    @patch('phone_migration.operations._build_file_list',
+           side_effect=lambda uri, rel_path, file_list: file_list.append("file1.txt"))
+    @patch('phone_migration.gio_utils.gio_copy', side_effect=KeyboardInterrupt)
+    def test_quiet_backup_interrupt_prints_nothing(self, mock_copy, mock_build, mock_save, mock_load):
+        """An interrupted quiet backup re-raises without printing the resume banner."""
+        rule = {
+            "id": "test-quiet-backup",
+            "phone_path": "/Videos/backup",
+            "desktop_path": str(self.dest_dir)
+        }
+        device = {"activation_uri": "mtp://device/"}
+        out = io.StringIO()
+        
+        with patch('phone_migration.paths.build_phone_uri', return_value="mtp://device/Videos/backup"):
+            with patch('phone_migration.paths.expand_desktop', return_value=self.dest_dir):
+                with redirect_stdout(out):
+                    with self.assertRaises(KeyboardInterrupt):
+                        operations.run_backup_rule(rule, device, quiet=True)
+        
+        self.assertEqual(out.getvalue(), "")
+
+
 class TestRenameConflictHandling(TestOperationsBase):
     """Test conflict handling with rename_duplicates parameter."""
     
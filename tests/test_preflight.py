@@ -0,0 +1,79 @@
+"""
+Tests for preflight size estimation.
+Uses temporary directories; no MTP device required.
+"""
+
+import os
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from phone_migration.preflight import estimate_transfer_size
+
+
+class TestEstimateTransferSize(unittest.TestCase):
+    """Test estimate_transfer_size on local directory trees."""
+
+    def setUp(self):
+        """Create a temporary source directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.source_dir = Path(self.temp_dir) / "source"
+        self.source_dir.mkdir()
+
+    def tearDown(self):
+        """Clean up temporary directories."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def create_file(self, rel_path: str, size: int) -> Path:
+        """Helper to create a file of the given size under the source directory."""
+        file_path = self.source_dir / rel_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(b"x" * size)
+        return file_path
+
+    def test_sums_files_in_nested_directories(self):
+        """Files at every depth are counted."""
+        self.create_file("top.bin", 10)
+        self.create_file("a/mid.bin", 200)
+        self.create_file("a/b/c/deep.bin", 3000)
+        (self.source_dir / "empty").mkdir()
+
+        self.assertEqual(estimate_transfer_size(str(self.source_dir)), 3210)
+
+    def test_symlink_loop_counted_once(self):
+        """A directory symlink pointing back up the tree is not walked twice."""
+        self.create_file("file.bin", 100)
+        self.create_file("sub/inner.bin", 20)
+        os.symlink(self.source_dir, self.source_dir / "sub" / "loop")
+
+        self.assertEqual(estimate_transfer_size(str(self.source_dir)), 120)
+
+    def test_broken_symlink_warned_and_skipped(self):
+        """A dangling symlink logs a warning and adds nothing."""
+        self.create_file("file.bin", 50)
+        os.symlink(Path(self.temp_dir) / "missing", self.source_dir / "dangling")
+
+        with self.assertLogs("phone_migration.preflight", level="WARNING") as logs:
+            total = estimate_transfer_size(str(self.source_dir))
+
+        self.assertEqual(total, 50)
+        self.assertTrue(any("dangling" in message for message in logs.output))
+
+    def test_regular_file_source_path(self):
+        """A file given as source_path is not a directory to walk, so nothing is counted."""
+        file_path = self.create_file("single.bin", 500)
+
+        self.assertEqual(estimate_transfer_size(str(file_path)), 0)
+
+    def test_missing_source_path(self):
+        """A nonexistent source_path estimates zero bytes."""
+        self.assertEqual(estimate_transfer_size(str(self.source_dir / "nope")), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()